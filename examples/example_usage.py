@@ -6,13 +6,18 @@ Demuestra cómo usar las clases principales para realizar optimizaciones.
 import sys
 import os
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+
+# Sin pantalla disponible, usar el backend Agg (solo archivos) antes de importar
+# pyplot para no inicializar Tk/Qt innecesariamente
+if (sys.platform.startswith('linux') and 'MPLBACKEND' not in os.environ
+        and not os.environ.get('DISPLAY') and not os.environ.get('WAYLAND_DISPLAY')):
+    matplotlib.use('Agg')
 
-# Agregar src al path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import matplotlib.pyplot as plt
 
-from solar_panel_model import SolarPanelModel
-from numerical_methods import NumericalOptimizer
+from modelo_panel_ifer2025 import NumericalOptimizer
+from modelo_panel_ifer2025.solar_panel_model import REPRESENTATIVE_DAYS, DAYS_IN_MONTH, cached_model
 
 
 def example_daily_optimization():
@@ -20,7 +25,7 @@ def example_daily_optimization():
     print("=== OPTIMIZACIÓN DIARIA ===")
     
     # Crear modelo para Madrid (latitud 40.4°)
-    madrid_model = SolarPanelModel(latitude=40.4, panel_area=2.0, efficiency=0.22)
+    madrid_model = cached_model(latitude=40.4, panel_area=2.0, efficiency=0.22)
     optimizer = NumericalOptimizer(madrid_model)
     
     # Día del solsticio de verano (día 172)
@@ -56,11 +61,12 @@ def example_annual_optimization():
     
     for lat in latitudes:
         print(f"\nOptimizando para latitud {lat}°")
-        model = SolarPanelModel(latitude=lat, panel_area=1.0, efficiency=0.20)
+        model = cached_model(latitude=lat, panel_area=1.0, efficiency=0.20)
         optimizer = NumericalOptimizer(model)
         
-        # Usar búsqueda ternaria para rapidez
-        optimal_angle, max_energy, history = optimizer.ternary_search(
+        # Sección áurea: reutiliza un punto por iteración y necesita menos
+        # evaluaciones que la búsqueda ternaria para la misma tolerancia
+        optimal_angle, max_energy, history = optimizer.golden_section_search(
             0, 90, tolerance=0.1, optimization_type='annual')
         
         results_by_latitude[lat] = {
@@ -81,7 +87,7 @@ def example_sensitivity_analysis():
     print("\n=== ANÁLISIS DE SENSIBILIDAD ===")
     
     # Modelo para Barcelona (latitud 41.4°)
-    barcelona_model = SolarPanelModel(latitude=41.4, panel_area=1.5, efficiency=0.21)
+    barcelona_model = cached_model(latitude=41.4, panel_area=1.5, efficiency=0.21)
     optimizer = NumericalOptimizer(barcelona_model)
     
     # Encontrar ángulo óptimo anual
@@ -91,7 +97,8 @@ def example_sensitivity_analysis():
     print(f"Ángulo óptimo para Barcelona: {optimal_angle:.1f}°")
     print(f"Energía máxima anual: {max_energy:.1f} kWh")
     
-    # Análisis de sensibilidad
+    # Análisis de sensibilidad; la energía del óptimo se recalcula en la misma
+    # llamada vectorizada que la muestra para que la pérdida en él sea 0
     sensitivity_data = optimizer.sensitivity_analysis(
         optimal_angle, range_percent=15, optimization_type='annual')
     
@@ -105,24 +112,47 @@ def example_sensitivity_analysis():
     return sensitivity_data
 
 
+def example_seasonal_comparison():
+    """Ejemplo de energía diaria en equinoccios y solsticios."""
+    print("\n=== COMPARACIÓN ESTACIONAL ===")
+    
+    model = cached_model(latitude=40.4, panel_area=1.0, efficiency=0.20)
+    
+    angles = np.array([0, 20, 40, 60, 90], dtype=np.float64)
+    days = {80: 'Equinoccio mar.', 172: 'Solsticio jun.',
+            266: 'Equinoccio sep.', 355: 'Solsticio dic.'}
+    
+    # Todas las combinaciones (ángulo, día) en una sola pasada vectorizada
+    energies = model.daily_energy_matrix(angles, list(days))
+    
+    print("Energía diaria (Wh) para Madrid (latitud 40.4°):")
+    print("Ángulo (°) | " + " | ".join(f"{name:>15}" for name in days.values()))
+    print("-" * 80)
+    for angle, row in zip(angles, energies):
+        print(f"{angle:8.0f}   | " + " | ".join(f"{energy:15.1f}" for energy in row))
+    
+    # Mejor ángulo de la muestra para cada día
+    best = angles[energies.argmax(axis=0)]
+    print("Mejor ángulo: " + ", ".join(f"{name} {angle:.0f}°" for name, angle in zip(days.values(), best)))
+    
+    return energies
+
+
 def plot_comparison_example():
     """Crear gráficas de ejemplo."""
     print("\n=== CREANDO GRÁFICAS DE EJEMPLO ===")
     
     # Modelo para análisis
-    model = SolarPanelModel(latitude=35.0, panel_area=1.0, efficiency=0.20)
+    model = cached_model(latitude=35.0, panel_area=1.0, efficiency=0.20)
     
     # Calcular energía para diferentes ángulos
-    angles = np.arange(0, 91, 2)
-    daily_energies = []
-    annual_energies = []
+    angles = np.arange(0, 91, 2, dtype=np.float64)  # Reutilizado por ambas curvas
     
     print("Calculando energías para diferentes ángulos...")
-    for angle in angles:
-        daily_energy = model.daily_energy(angle, 172)  # Solsticio
-        annual_energy = model.annual_energy(angle)
-        daily_energies.append(daily_energy)
-        annual_energies.append(annual_energy)
+    # Una sola matriz (ángulos, días) para ambas curvas
+    E = model.energy_matrix(angles)
+    daily_energies = E[:, 172 - 1]  # Solsticio
+    annual_energies = E[:, REPRESENTATIVE_DAYS - 1] @ DAYS_IN_MONTH / 1000
     
     # Crear gráficas
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
@@ -138,7 +168,7 @@ def plot_comparison_example():
     max_daily_idx = np.argmax(daily_energies)
     ax1.scatter(angles[max_daily_idx], daily_energies[max_daily_idx], 
                color='red', s=100, marker='*', zorder=5,
-               label=f'Óptimo: {angles[max_daily_idx]}°')
+               label=f'Óptimo: {angles[max_daily_idx]:.0f}°')
     ax1.legend()
     
     # Gráfica anual
@@ -152,7 +182,7 @@ def plot_comparison_example():
     max_annual_idx = np.argmax(annual_energies)
     ax2.scatter(angles[max_annual_idx], annual_energies[max_annual_idx], 
                color='red', s=100, marker='*', zorder=5,
-               label=f'Óptimo: {angles[max_annual_idx]}°')
+               label=f'Óptimo: {angles[max_annual_idx]:.0f}°')
     ax2.legend()
     
     plt.tight_layout()
@@ -164,7 +194,10 @@ def plot_comparison_example():
     except:
         print("No se pudo guardar la gráfica")
     
-    plt.show()
+    # plt.show() no hace nada con Agg; solo mostrar con un backend interactivo
+    if matplotlib.get_backend().lower() != 'agg':
+        plt.show()
+    plt.close(fig)
 
 
 def main():
@@ -177,6 +210,7 @@ def main():
         daily_results = example_daily_optimization()
         annual_results = example_annual_optimization()
         sensitivity_data = example_sensitivity_analysis()
+        seasonal_energies = example_seasonal_comparison()
         
         # Crear gráficas si matplotlib está disponible
         try:
@@ -186,7 +220,7 @@ def main():
         
         print("\n" + "=" * 50)
         print("RESUMEN DE EJEMPLOS COMPLETADO")
-        print("Para usar la interfaz gráfica, ejecute: python src/main.py")
+        print("Para usar la interfaz gráfica, ejecute: python -m modelo_panel_ifer2025.main")
         
     except Exception as e:
         print(f"Error durante la ejecución de ejemplos: {e}")
@@ -0,0 +1,29 @@
+"""
+Compilación de la extensión opcional en Cython (_solar_kernel.pyx).
+Los metadatos del paquete están en pyproject.toml.
+
+Uso:
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+import sys
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Sin Cython se instala solo la versión Python/Numba
+    cythonize = None
+
+if sys.platform == 'win32':
+    extra_compile_args = ['/O2', '/fp:fast']
+else:
+    extra_compile_args = ['-O3', '-ffast-math', '-march=native']
+
+extensions = [
+    Extension('modelo_panel_ifer2025._solar_kernel',
+              ['src/modelo_panel_ifer2025/_solar_kernel.pyx'],
+              extra_compile_args=extra_compile_args),
+]
+
+setup(ext_modules=cythonize(extensions) if cythonize else [])
@@ -0,0 +1,11 @@
+"""
+Simulador de panel solar.
+Modelo físico de radiación y métodos numéricos para encontrar el ángulo
+óptimo de inclinación del panel. La interfaz gráfica se encuentra en el
+submódulo ``gui`` y requiere PyQt5.
+"""
+
+from .solar_panel_model import SolarPanelModel
+from .numerical_methods import NumericalOptimizer
+
+__all__ = ['SolarPanelModel', 'NumericalOptimizer']
@@ -5,8 +5,9 @@ usando diferentes métodos numéricos.
 """
 
 import sys
+import queue
+from operator import itemgetter
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
@@ -14,61 +15,128 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                            QPushButton, QComboBox, QTextEdit, QTabWidget,
                            QGroupBox, QSpinBox, QDoubleSpinBox, QProgressBar,
                            QMessageBox, QSplitter, QFrame)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
 
-from solar_panel_model import SolarPanelModel
-from numerical_methods import NumericalOptimizer
+from .solar_panel_model import cached_model
+from .numerical_methods import NumericalOptimizer
 
 
 class OptimizationWorker(QThread):
-    """Worker thread para realizar optimizaciones sin bloquear la UI."""
+    """
+    Worker thread para realizar optimizaciones sin bloquear la UI.
+    
+    Un único hilo persistente atiende una cola de trabajos, así que cada
+    optimización no paga la creación y destrucción de un hilo del sistema.
+    """
     
     finished = pyqtSignal(dict)
     progress = pyqtSignal(int)
     
-    def __init__(self, optimizer, method, params):
+    # Método del optimizador para cada identificador; el optimizador llega
+    # con cada trabajo, así que se guardan sin enlazar
+    _DISPATCH = {
+        'brute_force': NumericalOptimizer.brute_force_search,
+        'ternary_search': NumericalOptimizer.ternary_search,
+        'golden_section': NumericalOptimizer.golden_section_search,
+        'gradient_ascent': NumericalOptimizer.gradient_ascent,
+        'compare_all': NumericalOptimizer.compare_methods,
+    }
+    
+    def __init__(self):
         super().__init__()
-        self.optimizer = optimizer
-        self.method = method
-        self.params = params
+        self.jobs = queue.Queue()
+    
+    def submit(self, optimizer, method, params):
+        """Encolar una optimización."""
+        self.jobs.put((optimizer, method, params))
+    
+    def stop(self):
+        """Terminar el hilo tras los trabajos pendientes."""
+        self.jobs.put(None)
+        self.wait()
     
     def run(self):
-        try:
-            if self.method == 'brute_force':
-                result = self.optimizer.brute_force_search(**self.params)
-            elif self.method == 'ternary_search':
-                result = self.optimizer.ternary_search(**self.params)
-            elif self.method == 'golden_section':
-                result = self.optimizer.golden_section_search(**self.params)
-            elif self.method == 'gradient_ascent':
-                result = self.optimizer.gradient_ascent(**self.params)
-            elif self.method == 'compare_all':
-                result = self.optimizer.compare_methods(**self.params)
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
             
-            self.finished.emit({'success': True, 'result': result})
-        except Exception as e:
-            self.finished.emit({'success': False, 'error': str(e)})
+            optimizer, method, params = job
+            try:
+                result = self._DISPATCH[method](optimizer, **params)
+                self.finished.emit({'success': True, 'result': result})
+            except Exception as e:
+                self.finished.emit({'success': False, 'error': str(e)})
 
 
 class MplCanvas(FigureCanvas):
-    """Canvas personalizado para matplotlib."""
+    """
+    Canvas personalizado para matplotlib.
+    
+    Los ejes se crean una sola vez y se reutilizan en cada gráfica (se
+    limpian con ``cla``), en lugar de destruir y reconstruir la figura.
+    """
     
-    def __init__(self, parent=None, width=5, height=4, dpi=100):
+    def __init__(self, parent=None, width=5, height=4, dpi=100, nrows=1):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         super().__init__(self.fig)
         self.setParent(parent)
+        
+        self.axes = [self.fig.add_subplot(nrows, 1, i + 1) for i in range(nrows)]
+        self.ax = self.axes[0]
+        
+        # Márgenes fijos (con una sola fila caben las etiquetas giradas de la
+        # comparación): el tamaño de la figura no cambia, así que no hace falta
+        # recalcular el diseño en cada gráfica
+        self.fig.subplots_adjust(left=0.1, right=0.97, top=0.94,
+                                 bottom=0.2 if nrows == 1 else 0.1, hspace=0.5)
+        self.clear_axes()
+    
+    def clear_axes(self, visible=False):
+        """
+        Limpia los ejes para volver a dibujar sobre ellos.
+        
+        Args:
+            visible (bool): Mostrar los ejes (False deja el canvas en blanco)
+        """
+        for ax in self.axes:
+            ax.cla()
+            ax.set_visible(visible)
 
 
 class SolarPanelGUI(QMainWindow):
     """Interfaz gráfica principal para el simulador de panel solar."""
     
+    # Colores de las barras en la comparación de métodos
+    _COMPARISON_COLORS = ('#FF9999', '#66B2FF', '#99FF99', '#FFCC99')
+    
+    # Puntos de la curva de la función objetivo
+    _CURVE_POINTS = 100
+    
+    # Métodos del combo y su identificador en OptimizationWorker
+    _METHOD_MAP = {
+        "Búsqueda por fuerza bruta": "brute_force",
+        "Búsqueda ternaria": "ternary_search",
+        "Sección áurea": "golden_section",
+        "Ascenso por gradiente": "gradient_ascent",
+        "Comparar todos los métodos": "compare_all"
+    }
+    
     def __init__(self):
         super().__init__()
         self.solar_model = None
         self.optimizer = None
         self.optimization_results = {}
-        self.current_worker = None
+        
+        # Hilo de optimización persistente, reutilizado en cada clic
+        self.worker = OptimizationWorker()
+        self.worker.finished.connect(self.on_optimization_finished)
+        self.worker.start()
+        
+        # Curvas de la función objetivo ya calculadas, por parámetros
+        self._curve_cache = {}
+        self._last_method = None
         
         self.init_ui()
         self.connect_signals()
@@ -180,13 +248,7 @@ class SolarPanelGUI(QMainWindow):
         method_layout = QVBoxLayout(method_group)
         
         self.method_combo = QComboBox()
-        self.method_combo.addItems([
-            "Búsqueda por fuerza bruta",
-            "Búsqueda ternaria",
-            "Sección áurea",
-            "Ascenso por gradiente",
-            "Comparar todos los métodos"
-        ])
+        self.method_combo.addItems(list(self._METHOD_MAP))
         method_layout.addWidget(self.method_combo)
         
         # Botón de optimización
@@ -263,9 +325,12 @@ class SolarPanelGUI(QMainWindow):
         self.tabs.addTab(self.comparison_canvas, "Comparación de Métodos")
         
         # Pestaña de análisis diario/anual
-        self.analysis_canvas = MplCanvas(width=8, height=6)
+        self.analysis_canvas = MplCanvas(width=8, height=6, nrows=2)
         self.tabs.addTab(self.analysis_canvas, "Análisis Temporal")
         
+        # Pestañas con cambios sin dibujar: se dibujan al mostrarse
+        self._canvas_dirty = {index: False for index in range(self.tabs.count())}
+        
         return panel
     
     def connect_signals(self):
@@ -274,7 +339,20 @@ class SolarPanelGUI(QMainWindow):
         self.analysis_button.clicked.connect(self.run_sensitivity_analysis)
         self.clear_button.clicked.connect(self.clear_results)
         self.optimization_type.currentTextChanged.connect(self.update_day_visibility)
-        self.latitude_input.valueChanged.connect(self.update_angle_range)
+        self.tabs.currentChanged.connect(self.draw_pending_canvas)
+        
+        # Recalcular el rango de ángulos solo cuando la latitud deja de cambiar
+        # (al escribir "40.25" valueChanged se emite en cada pulsación)
+        self._angle_debounce = QTimer(self)
+        self._angle_debounce.setSingleShot(True)
+        self._angle_debounce.setInterval(150)
+        self._angle_debounce.timeout.connect(self.update_angle_range)
+        self.latitude_input.valueChanged.connect(lambda _: self._angle_debounce.start())
+        
+        # Las curvas cacheadas dejan de servir al cambiar el sistema
+        self.latitude_input.valueChanged.connect(self.clear_curve_cache)
+        self.area_input.valueChanged.connect(self.clear_curve_cache)
+        self.efficiency_input.valueChanged.connect(self.clear_curve_cache)
     
     def load_default_values(self):
         """Cargar valores por defecto."""
@@ -282,9 +360,16 @@ class SolarPanelGUI(QMainWindow):
         self.update_day_visibility()
     
     def update_day_visibility(self):
-        """Actualizar visibilidad del campo día del año."""
-        is_daily = self.optimization_type.currentText() == "Diaria"
-        self.day_of_year.setEnabled(is_daily)
+        """
+        Actualizar visibilidad del campo día del año.
+        
+        También guarda el tipo de optimización elegido, para no consultar el
+        combo de Qt en cada gráfica o texto de resultados.
+        """
+        self._is_daily = self.optimization_type.currentText() == "Diaria"
+        self._optimization_mode = 'daily' if self._is_daily else 'annual'
+        self._unit = 'Wh' if self._is_daily else 'kWh'
+        self.day_of_year.setEnabled(self._is_daily)
     
     def update_angle_range(self):
         """Actualizar rango de ángulos basado en latitud."""
@@ -292,19 +377,28 @@ class SolarPanelGUI(QMainWindow):
         min_suggested = max(0, latitude - 20)
         max_suggested = min(90, latitude + 20)
         
-        self.min_angle.setValue(min_suggested)
-        self.max_angle.setValue(max_suggested)
+        # Sin señales intermedias mientras se ajustan ambos extremos
+        for spin_box, value in ((self.min_angle, min_suggested), (self.max_angle, max_suggested)):
+            spin_box.blockSignals(True)
+            spin_box.setValue(value)
+            spin_box.blockSignals(False)
     
     def get_current_model(self):
         """Obtener el modelo actual con los parámetros de la interfaz."""
-        latitude = self.latitude_input.value()
-        area = self.area_input.value()
-        efficiency = self.efficiency_input.value() / 100  # Convertir porcentaje
+        # Redondear a la precisión de los campos para que la caché acierte
+        latitude = round(self.latitude_input.value(), 2)
+        area = round(self.area_input.value(), 2)
+        efficiency = round(self.efficiency_input.value() / 100, 3)  # Convertir porcentaje
         
-        return SolarPanelModel(latitude, area, efficiency)
+        return cached_model(latitude, area, efficiency)
     
     def run_optimization(self):
         """Ejecutar la optimización."""
+        # Aplicar un cambio de latitud pendiente antes de leer el rango
+        if self._angle_debounce.isActive():
+            self._angle_debounce.stop()
+            self.update_angle_range()
+        
         try:
             # Crear modelo y optimizador
             self.solar_model = self.get_current_model()
@@ -313,7 +407,7 @@ class SolarPanelGUI(QMainWindow):
             # Parámetros de optimización
             min_angle = self.min_angle.value()
             max_angle = self.max_angle.value()
-            optimization_type = 'daily' if self.optimization_type.currentText() == 'Diaria' else 'annual'
+            optimization_type = self._optimization_mode
             day_of_year = self.day_of_year.value()
             
             # Verificar parámetros
@@ -331,15 +425,8 @@ class SolarPanelGUI(QMainWindow):
             
             # Determinar método
             method_text = self.method_combo.currentText()
-            method_map = {
-                "Búsqueda por fuerza bruta": "brute_force",
-                "Búsqueda ternaria": "ternary_search",
-                "Sección áurea": "golden_section",
-                "Ascenso por gradiente": "gradient_ascent",
-                "Comparar todos los métodos": "compare_all"
-            }
-            
-            method = method_map[method_text]
+            method = self._METHOD_MAP[method_text]
+            self._last_method = method
             
             # Configurar UI para optimización
             self.optimize_button.setEnabled(False)
@@ -347,10 +434,8 @@ class SolarPanelGUI(QMainWindow):
             self.progress_bar.setRange(0, 0)  # Progreso indeterminado
             self.statusBar().showMessage("Optimizando...")
             
-            # Ejecutar en worker thread
-            self.current_worker = OptimizationWorker(self.optimizer, method, params)
-            self.current_worker.finished.connect(self.on_optimization_finished)
-            self.current_worker.start()
+            # Ejecutar en el worker thread
+            self.worker.submit(self.optimizer, method, params)
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error durante la optimización: {str(e)}")
@@ -374,9 +459,6 @@ class SolarPanelGUI(QMainWindow):
         """Resetear UI después de optimización."""
         self.optimize_button.setEnabled(True)
         self.progress_bar.setVisible(False)
-        if self.current_worker:
-            self.current_worker.quit()
-            self.current_worker = None
     
     def display_results(self):
         """Mostrar resultados en el área de texto."""
@@ -393,13 +475,13 @@ class SolarPanelGUI(QMainWindow):
                 else:
                     text += f"{method.upper()}:\n"
                     text += f"  Ángulo óptimo: {data['angle']:.2f}°\n"
-                    text += f"  Energía máxima: {data['energy']:.2f} {'Wh' if self.optimization_type.currentText() == 'Diaria' else 'kWh'}\n"
+                    text += f"  Energía máxima: {data['energy']:.2f} {self._unit}\n"
                     text += f"  Evaluaciones: {data['evaluations']}\n\n"
         else:
             # Método individual
             angle, energy, history = results
             method_name = self.method_combo.currentText()
-            unit = 'Wh' if self.optimization_type.currentText() == 'Diaria' else 'kWh'
+            unit = self._unit
             
             text = f"=== {method_name.upper()} ===\n\n"
             text += f"Ángulo óptimo: {angle:.2f}°\n"
@@ -412,7 +494,7 @@ class SolarPanelGUI(QMainWindow):
             text += f"  Área del panel: {self.area_input.value()} m²\n"
             text += f"  Eficiencia: {self.efficiency_input.value()}%\n"
             
-            if self.optimization_type.currentText() == 'Diaria':
+            if self._is_daily:
                 text += f"  Día del año: {self.day_of_year.value()}\n"
         
         self.results_text.setText(text)
@@ -423,7 +505,7 @@ class SolarPanelGUI(QMainWindow):
             return
         
         # Limpiar canvas
-        self.optimization_canvas.fig.clear()
+        self.optimization_canvas.clear_axes(visible=True)
         
         results = self.optimization_results
         
@@ -434,33 +516,54 @@ class SolarPanelGUI(QMainWindow):
             # Método individual
             self.plot_single_method(results)
         
-        self.optimization_canvas.draw()
+        self.refresh_canvas(self.optimization_canvas)
     
     def plot_single_method(self, results):
         """Graficar resultado de un método individual."""
         angle, energy, history = results
         
-        if not history:
+        if len(history) == 0:
             return
         
-        angles = [point[0] for point in history]
-        energies = [point[1] for point in history]
+        angles, energies = history[:, 0], history[:, 1]
         
-        ax = self.optimization_canvas.fig.add_subplot(111)
+        ax = self.optimization_canvas.ax
         
         # Gráfica de la función objetivo
-        angle_range = np.linspace(self.min_angle.value(), self.max_angle.value(), 100)
-        energy_range = []
-        
-        optimization_type = 'daily' if self.optimization_type.currentText() == 'Diaria' else 'annual'
+        optimization_type = self._optimization_mode
         day_of_year = self.day_of_year.value()
         
-        for a in angle_range:
+        # Reutilizar la curva si se repite la optimización con los mismos
+        # parámetros (p. ej. al probar varios métodos seguidos)
+        model = self.solar_model
+        min_angle, max_angle = self.min_angle.value(), self.max_angle.value()
+        key = (model.latitude, model.panel_area, model.efficiency, optimization_type,
+               day_of_year if optimization_type == 'daily' else None,
+               min_angle, max_angle)
+        
+        # La fuerza bruta evalúa una malla ordenada de min_angle a max_angle
+        # (ambos incluidos); si cubre el rango dibujado con un paso no mayor
+        # que el de la curva, sirve directamente como curva
+        curve_step = (max_angle - min_angle) / (self._CURVE_POINTS - 1)
+        if (self._last_method == 'brute_force' and len(angles) > 1
+                and (angles[0], angles[-1]) == (min_angle, max_angle)
+                and angles[1] - angles[0] <= curve_step):
+            angle_range, energy_range = angles, energies
+        elif key not in self._curve_cache:
+            # La curva solo se dibuja: float32 sobra y el modelo ya evalúa la
+            # malla solar en float32
+            angle_range = np.linspace(min_angle, max_angle, self._CURVE_POINTS,
+                                      dtype=np.float32)
+            
+            # Toda la curva en una sola llamada vectorizada
             if optimization_type == 'daily':
-                e = self.solar_model.daily_energy(a, day_of_year)
+                energy_range = model.daily_energy(angle_range, day_of_year)
             else:
-                e = self.solar_model.annual_energy(a)
-            energy_range.append(e)
+                energy_range = model.annual_energy(angle_range)
+            energy_range = energy_range.astype(np.float32)
+            self._curve_cache[key] = (angle_range, energy_range)
+        else:
+            angle_range, energy_range = self._curve_cache[key]
         
         ax.plot(angle_range, energy_range, 'b-', linewidth=2, label='Función objetivo')
         
@@ -472,7 +575,7 @@ class SolarPanelGUI(QMainWindow):
                   label=f'Óptimo: {angle:.1f}°', zorder=5)
         
         ax.set_xlabel('Ángulo de inclinación (°)')
-        unit = 'Wh' if self.optimization_type.currentText() == 'Diaria' else 'kWh'
+        unit = self._unit
         ax.set_ylabel(f'Energía ({unit})')
         ax.set_title(f'Optimización: {self.method_combo.currentText()}')
         ax.legend()
@@ -480,23 +583,19 @@ class SolarPanelGUI(QMainWindow):
     
     def plot_method_comparison(self, results):
         """Graficar comparación de métodos."""
-        ax = self.optimization_canvas.fig.add_subplot(111)
-        
-        methods = []
-        angles = []
-        energies = []
-        evaluations = []
+        ax = self.optimization_canvas.ax
         
-        for method, data in results.items():
-            if 'error' not in data:
-                methods.append(method.replace('_', ' ').title())
-                angles.append(data['angle'])
-                energies.append(data['energy'])
-                evaluations.append(data['evaluations'])
+        valid = {method.replace('_', ' ').title(): data
+                 for method, data in results.items() if 'error' not in data}
+        methods = list(valid)
+        angles = np.fromiter(map(itemgetter('angle'), valid.values()), dtype=np.float64,
+                             count=len(valid))
+        evaluations = np.fromiter(map(itemgetter('evaluations'), valid.values()), dtype=np.int64,
+                                  count=len(valid))
         
         # Gráfica de barras para ángulos óptimos
         x = np.arange(len(methods))
-        bars = ax.bar(x, angles, color=['#FF9999', '#66B2FF', '#99FF99', '#FFCC99'])
+        bars = ax.bar(x, angles, color=self._COMPARISON_COLORS[:len(methods)])
         
         ax.set_xlabel('Método de optimización')
         ax.set_ylabel('Ángulo óptimo (°)')
@@ -504,15 +603,11 @@ class SolarPanelGUI(QMainWindow):
         ax.set_xticks(x)
         ax.set_xticklabels(methods, rotation=45, ha='right')
         
-        # Agregar valores sobre las barras
-        for i, (bar, angle, energy, evals) in enumerate(zip(bars, angles, energies, evaluations)):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{angle:.1f}°\n({evals} eval.)',
-                   ha='center', va='bottom', fontsize=9)
+        # Agregar valores sobre las barras en una sola llamada
+        labels = [f'{angle:.1f}°\n({evals} eval.)' for angle, evals in zip(angles, evaluations)]
+        ax.bar_label(bars, labels=labels, padding=3, fontsize=9)
         
         ax.grid(True, alpha=0.3)
-        plt.tight_layout()
     
     def run_sensitivity_analysis(self):
         """Ejecutar análisis de sensibilidad."""
@@ -532,7 +627,7 @@ class SolarPanelGUI(QMainWindow):
                 optimal_angle = results[0]
             
             # Ejecutar análisis
-            optimization_type = 'daily' if self.optimization_type.currentText() == 'Diaria' else 'annual'
+            optimization_type = self._optimization_mode
             day_of_year = self.day_of_year.value()
             
             sensitivity_data = self.optimizer.sensitivity_analysis(
@@ -549,21 +644,17 @@ class SolarPanelGUI(QMainWindow):
     
     def plot_sensitivity_analysis(self, sensitivity_data, optimal_angle):
         """Graficar análisis de sensibilidad."""
-        self.analysis_canvas.fig.clear()
+        self.analysis_canvas.clear_axes(visible=True)
         
-        angles = [data[0] for data in sensitivity_data]
-        energies = [data[1] for data in sensitivity_data]
-        losses = [data[2] for data in sensitivity_data]
+        angles, energies, losses = sensitivity_data.T
         
-        # Crear subplots
-        ax1 = self.analysis_canvas.fig.add_subplot(211)
-        ax2 = self.analysis_canvas.fig.add_subplot(212)
+        ax1, ax2 = self.analysis_canvas.axes
         
         # Gráfica de energía vs ángulo
         ax1.plot(angles, energies, 'b-', linewidth=2, marker='o')
         ax1.axvline(optimal_angle, color='red', linestyle='--', label=f'Óptimo: {optimal_angle:.1f}°')
         ax1.set_xlabel('Ángulo de inclinación (°)')
-        unit = 'Wh' if self.optimization_type.currentText() == 'Diaria' else 'kWh'
+        unit = self._unit
         ax1.set_ylabel(f'Energía ({unit})')
         ax1.set_title('Análisis de Sensibilidad')
         ax1.legend()
@@ -577,25 +668,54 @@ class SolarPanelGUI(QMainWindow):
         ax2.set_title('Pérdida de Energía vs Ángulo Óptimo')
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        self.analysis_canvas.draw()
+        self.refresh_canvas(self.analysis_canvas)
+    
+    def refresh_canvas(self, canvas):
+        """
+        Dibujar un canvas si su pestaña está visible, o marcarlo como pendiente.
+        
+        Args:
+            canvas (MplCanvas): Canvas modificado
+        """
+        index = self.tabs.indexOf(canvas)
+        if index == self.tabs.currentIndex():
+            canvas.draw()
+            self._canvas_dirty[index] = False
+        else:
+            self._canvas_dirty[index] = True
+    
+    def draw_pending_canvas(self, index):
+        """Dibujar el canvas de la pestaña mostrada si tiene cambios pendientes."""
+        if self._canvas_dirty.get(index):
+            self.tabs.widget(index).draw()
+            self._canvas_dirty[index] = False
+    
+    def clear_curve_cache(self):
+        """Descartar las curvas de la función objetivo cacheadas."""
+        self._curve_cache.clear()
     
     def clear_results(self):
         """Limpiar resultados y gráficas."""
         self.results_text.clear()
         self.optimization_results = {}
+        self.clear_curve_cache()
         self.analysis_button.setEnabled(False)
         
         # Limpiar canvas
-        self.optimization_canvas.fig.clear()
-        self.comparison_canvas.fig.clear()
-        self.analysis_canvas.fig.clear()
+        self.optimization_canvas.clear_axes()
+        self.comparison_canvas.clear_axes()
+        self.analysis_canvas.clear_axes()
         
-        self.optimization_canvas.draw()
-        self.comparison_canvas.draw()
-        self.analysis_canvas.draw()
+        self.refresh_canvas(self.optimization_canvas)
+        self.refresh_canvas(self.comparison_canvas)
+        self.refresh_canvas(self.analysis_canvas)
         
         self.statusBar().showMessage("Resultados limpiados")
+    
+    def closeEvent(self, event):
+        """Detener el hilo de optimización al cerrar la ventana."""
+        self.worker.stop()
+        super().closeEvent(event)
 
 
 def main():
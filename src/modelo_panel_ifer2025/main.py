@@ -0,0 +1,11 @@
+"""
+Programa principal para el simulador de panel solar.
+Punto de entrada para ejecutar la aplicación con interfaz gráfica:
+
+    python -m modelo_panel_ifer2025.main
+"""
+
+from modelo_panel_ifer2025.gui import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,483 @@
+"""
+Métodos numéricos para encontrar el ángulo óptimo de inclinación del panel solar.
+Implementa algoritmos de optimización como búsqueda ternaria, método de Newton-Raphson,
+y búsqueda de fuerza bruta para maximizar la energía captada.
+"""
+
+import numpy as np
+import math
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+from scipy.optimize import minimize_scalar
+from .solar_panel_model import SolarPanelModel
+
+
+def _run_method(method: Callable, *args, **kwargs) -> dict:
+    """
+    Ejecuta un método de optimización y resume su resultado.
+    
+    La comparación solo necesita el número de evaluaciones, así que el método
+    se ejecuta sin registrar su historial.
+    
+    Args:
+        method (Callable): Método de búsqueda de NumericalOptimizer
+        *args: Argumentos posicionales del método
+        **kwargs: Argumentos por nombre del método
+        
+    Returns:
+        dict: Ángulo, energía y evaluaciones, o el error producido
+    """
+    try:
+        angle, energy, evaluations = method(*args, track_history=False, **kwargs)
+        return {
+            'angle': angle,
+            'energy': energy,
+            'evaluations': evaluations
+        }
+    except Exception as e:
+        return {'error': str(e)}
+
+
+class NumericalOptimizer:
+    """
+    Clase que implementa diferentes métodos numéricos para encontrar
+    el ángulo óptimo de inclinación del panel solar.
+    """
+    
+    def __init__(self, solar_model: SolarPanelModel):
+        """
+        Inicializa el optimizador con un modelo de panel solar.
+        
+        Args:
+            solar_model (SolarPanelModel): Instancia del modelo de panel solar
+        """
+        self.solar_model = solar_model
+        self.optimization_history = []
+        self._init_energy_cache()
+    
+    def __getstate__(self):
+        # El lru_cache no es serializable: se reconstruye al deserializar
+        state = self.__dict__.copy()
+        del state['_energy_cache']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_energy_cache()
+    
+    def _init_energy_cache(self):
+        """Crea la caché de evaluaciones de la función objetivo."""
+        self._energy_cache = functools.lru_cache(maxsize=256)(self._evaluate_energy)
+    
+    def _evaluate_energy(self, angle_key: int, optimization_type: str,
+                         day_of_year: int) -> float:
+        """Evalúa la función objetivo para un ángulo expresado en microgrados."""
+        angle = angle_key / 1e6
+        if optimization_type == 'daily':
+            return self.solar_model.daily_energy(angle, day_of_year)
+        return self.solar_model.annual_energy(angle)
+    
+    def energy(self, angle: float, optimization_type: str = 'daily',
+               day_of_year: int = 172) -> float:
+        """
+        Evalúa la función objetivo (energía captada) para un ángulo.
+        
+        Los resultados se memorizan por ángulo redondeado a 1e-6 grados, de modo
+        que los puntos que los métodos de búsqueda vuelven a visitar no se
+        recalculan.
+        
+        Args:
+            angle (float): Ángulo de inclinación en grados
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            
+        Returns:
+            float: Energía en Wh (diaria) o kWh (anual)
+        """
+        return self._energy_cache(round(angle * 1e6), optimization_type, day_of_year)
+    
+    def energy_vec(self, angles: np.ndarray, optimization_type: str = 'daily',
+                   day_of_year: int = 172) -> np.ndarray:
+        """
+        Evalúa la función objetivo para varios ángulos en una sola llamada.
+        
+        Args:
+            angles (np.ndarray): Ángulos de inclinación en grados
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            
+        Returns:
+            np.ndarray: Energía en Wh (diaria) o kWh (anual) para cada ángulo
+        """
+        if optimization_type == 'daily':
+            return self.solar_model.daily_energy_vec(angles, day_of_year)
+        return self.solar_model.annual_energy_vec(angles)
+    
+    def clear_history(self):
+        """Limpia el historial de optimización."""
+        self.optimization_history = []
+    
+    def _history_array(self, history: list) -> np.ndarray:
+        """
+        Guarda el historial de una búsqueda y lo retorna como array contiguo.
+        
+        Cada búsqueda acumula su historial en una lista local y solo lo publica
+        al terminar, de modo que varias búsquedas pueden ejecutarse a la vez
+        en hilos distintos sin mezclar sus puntos.
+        
+        Args:
+            history (list): Puntos (ángulo, energía) evaluados por la búsqueda
+            
+        Returns:
+            np.ndarray: Array (N, 2) con filas (ángulo, energía)
+        """
+        self.optimization_history = history
+        return np.array(history, dtype=np.float64).reshape(-1, 2)
+    
+    def brute_force_search(self, min_angle: float, max_angle: float, 
+                          step: float = 0.5, optimization_type: str = 'daily',
+                          day_of_year: int = 172,
+                          track_history: bool = True) -> Tuple[float, float, np.ndarray]:
+        """
+        Búsqueda por fuerza bruta para encontrar el ángulo óptimo.
+        
+        Todos los ángulos candidatos se evalúan en una sola llamada vectorizada.
+        
+        Args:
+            min_angle (float): Ángulo mínimo en grados
+            max_angle (float): Ángulo máximo en grados
+            step (float): Paso de búsqueda en grados; si no divide el intervalo
+                se ajusta al más cercano que lo haga, de modo que la malla va
+                de min_angle a max_angle exactamente
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            track_history (bool): Si es False no se guarda el historial y se
+                retorna solo el número de evaluaciones
+            
+        Returns:
+            tuple: (ángulo_óptimo, energía_máxima, historial_puntos (N, 2)
+                o número de evaluaciones)
+        """
+        # Con linspace la malla termina exactamente en max_angle, sin el punto
+        # de más que arange produce con pasos que no dividen el intervalo
+        num_angles = max(2, round((max_angle - min_angle) / step) + 1)
+        angles = np.linspace(min_angle, max_angle, num_angles)
+        energies = self.energy_vec(angles, optimization_type, day_of_year)
+        
+        # float como el resto de métodos, no escalares np.float64
+        max_idx = np.argmax(energies)
+        optimal_angle = float(angles[max_idx])
+        max_energy = float(energies[max_idx])
+        
+        if not track_history:
+            return optimal_angle, max_energy, len(angles)
+        
+        history = list(zip(angles.tolist(), energies.tolist()))
+        return optimal_angle, max_energy, self._history_array(history)
+    
+    def ternary_search(self, min_angle: float, max_angle: float, 
+                      tolerance: float = 1e-3, optimization_type: str = 'daily',
+                      day_of_year: int = 172,
+                      track_history: bool = True) -> Tuple[float, float, np.ndarray]:
+        """
+        Búsqueda ternaria para encontrar el ángulo óptimo.
+        
+        Args:
+            min_angle (float): Ángulo mínimo en grados
+            max_angle (float): Ángulo máximo en grados
+            tolerance (float): Tolerancia para la convergencia
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            track_history (bool): Si es False no se guarda el historial y se
+                retorna solo el número de evaluaciones
+            
+        Returns:
+            tuple: (ángulo_óptimo, energía_máxima, historial_puntos (N, 2)
+                o número de evaluaciones)
+        """
+        history = []
+        evaluations = 0
+        left = min_angle
+        right = max_angle
+        
+        energy_function = functools.partial(self.energy, optimization_type=optimization_type,
+                                            day_of_year=day_of_year)
+        
+        # Mejor punto evaluado hasta ahora; es el resultado, sin reevaluar al final
+        best_angle, best_energy = None, -math.inf
+        
+        iteration = 0
+        max_iterations = 100
+        
+        while (right - left) > tolerance and iteration < max_iterations:
+            # Dividir el intervalo en tres partes. Con tercios exactos el punto
+            # que sobrevive queda en el centro del nuevo intervalo y no se puede
+            # reutilizar (eso es lo que hace la sección áurea), así que se
+            # evalúan ambos. Dos llamadas escalares cacheadas son más baratas
+            # que un energy_vec de solo dos ángulos
+            third = (right - left) / 3
+            m1 = left + third
+            m2 = right - third
+            f1 = energy_function(m1)
+            f2 = energy_function(m2)
+            
+            evaluations += 2
+            if track_history:
+                history.append((m1, f1))
+                history.append((m2, f2))
+            
+            if max(f1, f2) > best_energy:
+                best_angle, best_energy = (m1, f1) if f1 > f2 else (m2, f2)
+            
+            # Reducir el intervalo de búsqueda
+            if f1 < f2:
+                left = m1
+            else:
+                right = m2
+            
+            iteration += 1
+        
+        # Intervalo inicial ya dentro de la tolerancia: basta con su punto medio
+        if best_angle is None:
+            best_angle = (left + right) / 2
+            best_energy = energy_function(best_angle)
+            evaluations += 1
+            if track_history:
+                history.append((best_angle, best_energy))
+        
+        if not track_history:
+            return float(best_angle), float(best_energy), evaluations
+        return float(best_angle), float(best_energy), self._history_array(history)
+    
+    def golden_section_search(self, min_angle: float, max_angle: float,
+                             tolerance: float = 1e-3, optimization_type: str = 'daily',
+                             day_of_year: int = 172,
+                             track_history: bool = True) -> Tuple[float, float, np.ndarray]:
+        """
+        Búsqueda de sección áurea para encontrar el ángulo óptimo.
+        
+        Args:
+            min_angle (float): Ángulo mínimo en grados
+            max_angle (float): Ángulo máximo en grados
+            tolerance (float): Tolerancia para la convergencia
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            track_history (bool): Si es False no se guarda el historial y se
+                retorna solo el número de evaluaciones
+            
+        Returns:
+            tuple: (ángulo_óptimo, energía_máxima, historial_puntos (N, 2)
+                o número de evaluaciones)
+        """
+        history = []
+        evaluations = 2
+        
+        energy_function = functools.partial(self.energy, optimization_type=optimization_type,
+                                            day_of_year=day_of_year)
+        
+        # Razón áurea
+        phi = (1 + math.sqrt(5)) / 2
+        resphi = 2 - phi
+        
+        # Inicializar puntos
+        a = min_angle
+        b = max_angle
+        tol = tolerance
+        
+        # Puntos iniciales
+        x1 = a + resphi * (b - a)
+        x2 = b - resphi * (b - a)
+        f1 = energy_function(x1)
+        f2 = energy_function(x2)
+        
+        if track_history:
+            history.append((x1, f1))
+            history.append((x2, f2))
+        
+        # Mejor punto evaluado hasta ahora; es el resultado, sin reevaluar al final
+        best_angle, best_energy = (x1, f1) if f1 > f2 else (x2, f2)
+        
+        iteration = 0
+        max_iterations = 100
+        
+        while abs(b - a) > tol and iteration < max_iterations:
+            if f1 > f2:
+                b = x2
+                x2 = x1
+                f2 = f1
+                x1 = a + resphi * (b - a)
+                f1 = energy_function(x1)
+                if track_history:
+                    history.append((x1, f1))
+                if f1 > best_energy:
+                    best_angle, best_energy = x1, f1
+            else:
+                a = x1
+                x1 = x2
+                f1 = f2
+                x2 = b - resphi * (b - a)
+                f2 = energy_function(x2)
+                if track_history:
+                    history.append((x2, f2))
+                if f2 > best_energy:
+                    best_angle, best_energy = x2, f2
+            
+            evaluations += 1
+            iteration += 1
+        
+        if not track_history:
+            return float(best_angle), float(best_energy), evaluations
+        return float(best_angle), float(best_energy), self._history_array(history)
+    
+    def gradient_ascent(self, initial_angle: Optional[float] = None, learning_rate: float = 0.1,
+                       tolerance: float = 1e-3, optimization_type: str = 'daily',
+                       day_of_year: int = 172, min_angle: float = 0.0,
+                       max_angle: float = 90.0,
+                       track_history: bool = True) -> Tuple[float, float, np.ndarray]:
+        """
+        Busca el ángulo óptimo con el método acotado de Brent de SciPy.
+        
+        Sustituye al ascenso con tasa de aprendizaje fija y derivada numérica
+        (hasta 3000 evaluaciones) por interpolación parabólica con respaldo de
+        sección áurea, que converge en unas 10-20 evaluaciones.
+        
+        Args:
+            initial_angle (float): Se conserva por compatibilidad; el método
+                acotado no necesita punto de partida
+            learning_rate (float): Se conserva por compatibilidad (sin uso)
+            tolerance (float): Tolerancia en grados para la convergencia
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            min_angle (float): Ángulo mínimo en grados
+            max_angle (float): Ángulo máximo en grados
+            track_history (bool): Si es False no se guarda el historial y se
+                retorna solo el número de evaluaciones
+            
+        Returns:
+            tuple: (ángulo_óptimo, energía_máxima, historial_puntos (N, 2)
+                o número de evaluaciones)
+        """
+        history = []
+        
+        energy_function = functools.partial(self.energy, optimization_type=optimization_type,
+                                            day_of_year=day_of_year)
+        
+        def negative_energy(angle):
+            """Objetivo a minimizar; registra cada evaluación en el historial."""
+            energy = energy_function(angle)
+            if track_history:
+                history.append((angle, energy))
+            return -energy
+        
+        result = minimize_scalar(negative_energy, bounds=(min_angle, max_angle),
+                                 method='bounded', options={'xatol': tolerance})
+        
+        if not track_history:
+            return float(result.x), -float(result.fun), result.nfev
+        return float(result.x), -float(result.fun), self._history_array(history)
+    
+    def compare_methods(self, min_angle: float, max_angle: float,
+                       optimization_type: str = 'daily', day_of_year: int = 172,
+                       n_jobs: int = 1) -> dict:
+        """
+        Compara diferentes métodos de optimización.
+        
+        Por defecto los métodos se ejecutan uno tras otro: el núcleo de Numba
+        ``annual_energy_batch`` ya es paralelo, y lanzarlo a la vez desde
+        varios hilos es más lento y, con la capa de hilos ``workqueue`` de
+        Numba, aborta el proceso.
+        
+        Args:
+            min_angle (float): Ángulo mínimo en grados
+            max_angle (float): Ángulo máximo en grados
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            n_jobs (int): Número de hilos (1, el valor por defecto, ejecuta
+                secuencialmente; otros valores solo son seguros con las capas
+                de hilos ``omp`` o ``tbb`` de Numba)
+            
+        Returns:
+            dict: Para cada método, ``{'angle', 'energy', 'evaluations'}`` o
+                ``{'error'}``. Los métodos se ejecutan con
+                ``track_history=False``, así que el resultado no incluye la
+                clave ``'history'``; ``evaluations`` es el número de
+                evaluaciones de la función objetivo (ángulos candidatos en
+                fuerza bruta, ``nfev`` de SciPy en gradient_ascent), igual a la
+                longitud del historial que el método devolvería con
+                ``track_history=True``
+        """
+        initial_angle = (min_angle + max_angle) / 2
+        methods = [
+            ('brute_force', self.brute_force_search, (min_angle, max_angle, 1.0)),
+            ('ternary_search', self.ternary_search, (min_angle, max_angle, 1e-2)),
+            ('golden_section', self.golden_section_search, (min_angle, max_angle, 1e-2)),
+            ('gradient_ascent', self.gradient_ascent, (initial_angle, 0.1, 1e-2)),
+        ]
+        
+        # gradient_ascent recibe los límites por nombre: sus posicionales son
+        # (ángulo_inicial, tasa, tolerancia, tipo, día)
+        bounds = {'gradient_ascent': {'min_angle': min_angle, 'max_angle': max_angle}}
+        
+        def run(entry):
+            name, method, args = entry
+            return _run_method(method, *args, optimization_type, day_of_year,
+                               **bounds.get(name, {}))
+        
+        if n_jobs == 1:
+            outcomes = map(run, methods)
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                outcomes = list(executor.map(run, methods))
+        
+        return {name: outcome for (name, _, _), outcome in zip(methods, outcomes)}
+    
+    def sensitivity_analysis(self, optimal_angle: float, range_percent: float = 10,
+                           optimization_type: str = 'daily', day_of_year: int = 172,
+                           optimal_energy: Optional[float] = None) -> np.ndarray:
+        """
+        Realiza un análisis de sensibilidad alrededor del ángulo óptimo.
+        
+        Todos los ángulos de la muestra, y el propio óptimo si no se conoce su
+        energía, se evalúan en una sola llamada vectorizada.
+        
+        Args:
+            optimal_angle (float): Ángulo óptimo en grados
+            range_percent (float): Porcentaje de variación alrededor del óptimo
+            optimization_type (str): 'daily' o 'annual'
+            day_of_year (int): Día del año para optimización diaria
+            optimal_energy (float): Energía en el óptimo, si ya se calculó con
+                ``energy_vec`` para el mismo tipo y día. Un valor del camino
+                escalar (``energy``) difiere por redondeo y puede dar pérdidas
+                ligeramente negativas en el propio óptimo
+            
+        Returns:
+            np.ndarray: Array (N, 3) con filas (ángulo, energía, pérdida_porcentual)
+            
+        Raises:
+            ValueError: Si la energía en el óptimo es 0 (por ejemplo, en la
+                noche polar) y la pérdida porcentual no está definida
+        """
+        range_angle = optimal_angle * range_percent / 100
+        
+        angles = np.linspace(optimal_angle - range_angle, 
+                           optimal_angle + range_angle, 21)
+        angles = angles[(angles >= 0) & (angles <= 90)]  # Solo ángulos válidos
+        
+        if optimal_energy is not None:
+            energies = self.energy_vec(angles, optimization_type, day_of_year)
+        else:
+            # El óptimo va en la misma llamada que la muestra, así la pérdida se
+            # mide contra el mismo cálculo vectorizado
+            energies = self.energy_vec(np.append(angles, optimal_angle), optimization_type, day_of_year)
+            energies, optimal_energy = energies[:-1], energies[-1]
+        
+        if optimal_energy == 0:
+            raise ValueError("La energía en el ángulo óptimo es 0; "
+                             "la pérdida porcentual no está definida")
+        
+        # Pérdida porcentual en un único buffer, sin temporales intermedios
+        losses = np.subtract(optimal_energy, energies)
+        losses *= 100 / optimal_energy
+        
+        return np.column_stack([angles, energies, losses])
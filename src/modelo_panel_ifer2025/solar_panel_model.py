@@ -0,0 +1,644 @@
+"""
+Modelo matemático para panel solar y cálculo de energía captada.
+Este módulo contiene las funciones para calcular la radiación solar
+y la energía captada por un panel solar en función de su inclinación.
+"""
+
+import numpy as np
+import math
+from datetime import datetime, timedelta
+from functools import lru_cache
+from scipy.integrate import simpson
+
+try:
+    from ._solar_kernel import annual_energy_c
+except ImportError:  # Extensión Cython opcional (python setup.py build_ext --inplace)
+    annual_energy_c = None
+
+try:
+    from .solar_panel_model_numba import (instant_power, daily_energy_core,
+                                          annual_energy_core, annual_energy_batch,
+                                          irradiance_ufunc)
+except ImportError:  # Numba es opcional; se usa la versión NumPy
+    instant_power = None
+    daily_energy_core = annual_energy_core = annual_energy_batch = irradiance_ufunc = None
+
+
+# Días representativos de cada mes y número de días que representa cada uno
+REPRESENTATIVE_DAYS = np.array([17, 47, 75, 105, 135, 162, 198, 230, 266, 296, 326, 356])
+DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_DAY_WEIGHTS = DAYS_IN_MONTH.astype(np.float64)
+
+# Declinación solar (radianes) de los días 0-366; solo hay 365 valores útiles,
+# así que se calculan una vez en lugar de en cada llamada
+_DECLINATION_TABLE = np.radians(23.45 * np.sin(np.radians(360 * (284 + np.arange(367)) / 365))).tolist()
+
+
+@lru_cache(maxsize=None)
+def _hour_grid(time_step):
+    """
+    Horas de integración de un día, de 6 AM a 6 PM ambas incluidas.
+    
+    Con ``linspace`` la longitud es siempre round(12 / time_step) + 1 y la
+    última muestra es exactamente las 18 h, sin las muestras de más que
+    ``arange`` produce con pasos flotantes que no dividen 12.
+    
+    Args:
+        time_step (float): Paso de tiempo en horas
+        
+    Returns:
+        np.ndarray: Horas del día (float64)
+    """
+    return np.linspace(6, 18, max(2, round(12 / time_step) + 1))
+
+
+@lru_cache(maxsize=None)
+def _hour_weights(time_step):
+    """
+    Pesos de la regla de Simpson para las horas de integración de un día.
+    
+    Se expresan en unidades de ``time_step`` (1/3, 4/3, 2/3, ..., 1/3), de modo
+    que la energía sigue siendo Σ wᵢ·P(tᵢ) · time_step y los pesos se pueden
+    combinar con los de los días representativos. Si el paso no divide 12
+    horas, los pesos recogen el paso real de ``_hour_grid``.
+    
+    Args:
+        time_step (float): Paso de tiempo en horas
+        
+    Returns:
+        np.ndarray: Pesos float64, uno por hora de ``_hour_grid(time_step)``
+    """
+    hours = _hour_grid(time_step)
+    return simpson(np.eye(len(hours)), x=hours, axis=-1) / time_step
+
+
+class SolarPanelModel:
+    """
+    Clase para modelar el comportamiento de un panel solar y calcular
+    la energía captada basada en parámetros geográficos y de inclinación.
+    """
+    
+    # Atributos fijos: sin __dict__ por instancia y acceso más rápido en los
+    # métodos escalares, que se llaman miles de veces por optimización. Los
+    # parámetros se exponen como propiedades de solo lectura: las mallas, el
+    # seno y coseno de la latitud y las cachés de energía del optimizador
+    # dependen de ellos, así que otros valores requieren otro modelo
+    __slots__ = ('_latitude', '_sin_lat', '_cos_lat', '_panel_area', '_efficiency',
+                 '_solar_constant', '_atmosphere_factor', '_log_atmosphere',
+                 '_grid_cache', '_daylight_cache')
+    
+    def __init__(self, latitude, panel_area=1.0, efficiency=0.2):
+        """
+        Inicializa el modelo del panel solar.
+        
+        Args:
+            latitude (float): Latitud geográfica en grados
+            panel_area (float): Área del panel en m²
+            efficiency (float): Eficiencia del panel (0-1)
+        """
+        self._latitude = math.radians(latitude)  # Convertir a radianes
+        self._sin_lat = math.sin(self._latitude)
+        self._cos_lat = math.cos(self._latitude)
+        self._panel_area = panel_area
+        self._efficiency = efficiency
+        
+        # Constantes solares
+        self._solar_constant = 1367  # W/m² (constante solar)
+        self._atmosphere_factor = 0.7  # Factor de atenuación atmosférica
+        self._log_atmosphere = math.log(self._atmosphere_factor)  # factor**m = exp(m·log)
+        
+        # Mallas solares (día × hora) precalculadas; solo dependen de la latitud
+        self._grid_cache = {}
+        self._daylight_cache = {}
+        self._daylight_samples(0.5)
+    
+    @property
+    def latitude(self):
+        """float: Latitud geográfica en radianes."""
+        return self._latitude
+    
+    @property
+    def panel_area(self):
+        """float: Área del panel en m²."""
+        return self._panel_area
+    
+    @property
+    def efficiency(self):
+        """float: Eficiencia del panel (0-1)."""
+        return self._efficiency
+    
+    @property
+    def solar_constant(self):
+        """float: Constante solar en W/m²."""
+        return self._solar_constant
+    
+    @property
+    def atmosphere_factor(self):
+        """float: Factor de atenuación atmosférica."""
+        return self._atmosphere_factor
+    
+    def solar_declination(self, day_of_year):
+        """
+        Calcula la declinación solar para un día dado del año.
+        
+        Args:
+            day_of_year (int): Día del año (1-365)
+            
+        Returns:
+            float: Declinación solar en radianes
+        """
+        if isinstance(day_of_year, (int, np.integer)) and 0 <= day_of_year <= 366:
+            return _DECLINATION_TABLE[day_of_year]
+        return math.radians(23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365)))
+    
+    def hour_angle(self, hour):
+        """
+        Calcula el ángulo horario para una hora dada.
+        
+        Args:
+            hour (float): Hora del día (0-24)
+            
+        Returns:
+            float: Ángulo horario en radianes
+        """
+        return math.radians(15 * (hour - 12))
+    
+    def solar_elevation_angle(self, declination, hour_angle):
+        """
+        Calcula el ángulo de elevación solar.
+        
+        Args:
+            declination (float): Declinación solar en radianes
+            hour_angle (float): Ángulo horario en radianes
+            
+        Returns:
+            float: Ángulo de elevación solar en radianes
+        """
+        sin_elevation = (self._sin_lat * math.sin(declination) +
+                        self._cos_lat * math.cos(declination) * math.cos(hour_angle))
+        return math.asin(max(0, sin_elevation))
+    
+    def solar_azimuth_angle(self, declination, hour_angle, elevation):
+        """
+        Calcula el ángulo azimutal del sol.
+        
+        Args:
+            declination (float): Declinación solar en radianes
+            hour_angle (float): Ángulo horario en radianes
+            elevation (float): Ángulo de elevación solar en radianes
+            
+        Returns:
+            float: Ángulo azimutal en radianes
+        """
+        if elevation <= 0:
+            return 0
+        
+        # Componentes este y norte de la dirección del sol; ambas llevan el
+        # mismo factor 1/cos(elevación) > 0, que atan2 no necesita
+        east = -math.cos(declination) * math.sin(hour_angle)
+        north = (math.sin(declination) * self._cos_lat -
+                 math.cos(declination) * self._sin_lat * math.cos(hour_angle))
+        
+        # Medido desde el norte en sentido horario, en [0, 2π)
+        return math.atan2(east, north) % (2 * math.pi)
+    
+    def cos_incidence_angle(self, elevation, azimuth, panel_tilt, panel_azimuth=math.pi):
+        """
+        Calcula el coseno del ángulo de incidencia de la radiación sobre el panel.
+        
+        Args:
+            elevation (float): Ángulo de elevación solar en radianes
+            azimuth (float): Ángulo azimutal solar en radianes
+            panel_tilt (float): Ángulo de inclinación del panel en radianes
+            panel_azimuth (float): Ángulo azimutal del panel en radianes (por defecto sur)
+            
+        Returns:
+            float: Coseno de la incidencia limitado a [0, 1]; 0 si el sol
+                queda detrás del panel
+        """
+        cos_incidence = (math.sin(elevation) * math.cos(panel_tilt) +
+                        math.cos(elevation) * math.sin(panel_tilt) *
+                        math.cos(azimuth - panel_azimuth))
+        
+        return max(0, min(1, cos_incidence))
+    
+    def incidence_angle(self, elevation, azimuth, panel_tilt, panel_azimuth=math.pi):
+        """
+        Calcula el ángulo de incidencia de la radiación solar sobre el panel.
+        
+        Args:
+            elevation (float): Ángulo de elevación solar en radianes
+            azimuth (float): Ángulo azimutal solar en radianes
+            panel_tilt (float): Ángulo de inclinación del panel en radianes
+            panel_azimuth (float): Ángulo azimutal del panel en radianes (por defecto sur)
+            
+        Returns:
+            float: Ángulo de incidencia en radianes
+        """
+        return math.acos(self.cos_incidence_angle(elevation, azimuth, panel_tilt, panel_azimuth))
+    
+    def direct_normal_irradiance(self, elevation):
+        """
+        Calcula la irradiancia directa normal basada en el ángulo de elevación.
+        
+        Args:
+            elevation (float): Ángulo de elevación solar en radianes
+            
+        Returns:
+            float: Irradiancia directa normal en W/m²
+        """
+        if elevation <= 0:
+            return 0
+        
+        # Modelo simple de irradiancia directa
+        air_mass = 1 / math.sin(elevation)
+        
+        # Limitar la masa de aire para evitar valores extremos
+        air_mass = min(air_mass, 10)
+        
+        dni = self._solar_constant * math.exp(air_mass * self._log_atmosphere)
+        return max(0, dni)
+    
+    def total_irradiance_on_panel(self, dni, incidence_angle, elevation):
+        """
+        Calcula la irradiancia total sobre el panel inclinado.
+        
+        Args:
+            dni (float): Irradiancia directa normal en W/m²
+            incidence_angle (float): Ángulo de incidencia en radianes
+            elevation (float): Ángulo de elevación solar en radianes
+            
+        Returns:
+            float: Irradiancia total sobre el panel en W/m²
+        """
+        if incidence_angle >= math.pi/2:
+            return 0
+        
+        return self.total_irradiance_from_cos(dni, math.cos(incidence_angle), elevation)
+    
+    def total_irradiance_from_cos(self, dni, cos_incidence, elevation):
+        """
+        Calcula la irradiancia total sobre el panel a partir del coseno de la
+        incidencia, sin pasar por el ángulo (acos seguido de cos).
+        
+        Args:
+            dni (float): Irradiancia directa normal en W/m²
+            cos_incidence (float): Coseno del ángulo de incidencia
+                (``cos_incidence_angle``)
+            elevation (float): Ángulo de elevación solar en radianes
+            
+        Returns:
+            float: Irradiancia total sobre el panel en W/m²
+        """
+        if elevation <= 0 or cos_incidence <= 0:
+            return 0
+        
+        # Directa (dni·cos θ) + difusa (0.1·dni, aproximación simple) +
+        # reflejada del suelo (albedo 0.2 · dni·sin_el · 0.5 = 0.1·dni·sin_el)
+        return max(0, dni * (cos_incidence + 0.1 + 0.1 * math.sin(elevation)))
+    
+    def instantaneous_power(self, panel_tilt, day_of_year, hour):
+        """
+        Calcula la potencia instantánea generada por el panel.
+        
+        Args:
+            panel_tilt (float): Ángulo de inclinación del panel en grados
+            day_of_year (int): Día del año (1-365)
+            hour (float): Hora del día (0-24)
+            
+        Returns:
+            float: Potencia instantánea en vatios
+        """
+        if instant_power is not None:
+            return instant_power(self._latitude, math.radians(panel_tilt), day_of_year, hour,
+                                 self._solar_constant, self._log_atmosphere,
+                                 self._panel_area * self._efficiency)
+        
+        panel_tilt_rad = math.radians(panel_tilt)
+        declination = self.solar_declination(day_of_year)
+        h_angle = self.hour_angle(hour)
+        elevation = self.solar_elevation_angle(declination, h_angle)
+        
+        if elevation <= 0:
+            return 0
+        
+        azimuth = self.solar_azimuth_angle(declination, h_angle, elevation)
+        cos_incidence = self.cos_incidence_angle(elevation, azimuth, panel_tilt_rad)
+        dni = self.direct_normal_irradiance(elevation)
+        irradiance = self.total_irradiance_from_cos(dni, cos_incidence, elevation)
+        
+        return irradiance * self._panel_area * self._efficiency
+    
+    def daily_energy(self, panel_tilt, day_of_year, time_step=0.5):
+        """
+        Calcula la energía total generada en un día.
+        
+        Las horas del día se evalúan juntas sobre la malla solar, no con un
+        bucle sobre ``instantaneous_power``, y se integran con la regla de
+        Simpson.
+        
+        Args:
+            panel_tilt (float o np.ndarray): Ángulo(s) de inclinación del panel
+                en grados; con un array se evalúan todos en una sola pasada
+            day_of_year (int): Día del año (1-365)
+            time_step (float): Paso de tiempo en horas para la integración
+            
+        Returns:
+            float o np.ndarray: Energía total en Wh
+        """
+        if np.ndim(panel_tilt):
+            return self.daily_energy_vec(panel_tilt, day_of_year, time_step)
+        
+        if daily_energy_core is not None and day_of_year in range(1, 366):
+            row = tuple(g[int(day_of_year) - 1] for g in self._solar_grid(time_step))
+            return daily_energy_core(*row, _hour_weights(time_step), math.radians(panel_tilt),
+                                     self._panel_area * self._efficiency * time_step)
+        
+        # Sin Numba: todas las horas del día con operaciones de NumPy
+        return float(self.daily_energy_vec(panel_tilt, day_of_year, time_step))
+    
+    def annual_energy(self, panel_tilt, time_step=0.5):
+        """
+        Calcula la energía total generada en un año.
+        
+        Args:
+            panel_tilt (float o np.ndarray): Ángulo(s) de inclinación del panel
+                en grados; con un array se evalúan todos en una sola pasada
+            time_step (float): Paso de tiempo en horas para la integración diaria
+            
+        Returns:
+            float o np.ndarray: Energía total anual en kWh
+        """
+        if np.ndim(panel_tilt):
+            return self.annual_energy_vec(panel_tilt, time_step)
+        
+        scale = self._panel_area * self._efficiency * time_step
+        
+        if annual_energy_c is not None:
+            energy = annual_energy_c(*self._daylight_samples(time_step),
+                                     math.radians(panel_tilt), scale)
+        elif annual_energy_core is not None:
+            energy = annual_energy_core(*self._daylight_samples(time_step),
+                                        math.radians(panel_tilt), scale)
+        else:
+            return float(self.annual_energy_vec(panel_tilt, time_step))
+        
+        return energy / 1000  # Convertir a kWh
+    
+    def _sun_position_grid(self, days, hours):
+        """
+        Calcula la geometría solar para una malla de días y horas.
+        
+        Los argumentos se combinan por broadcasting de NumPy, de modo que
+        ``days[:, None]`` y ``hours[None, :]`` producen una malla (días, horas).
+        
+        Args:
+            days (np.ndarray): Días del año (1-365)
+            hours (np.ndarray): Horas del día (0-24)
+            
+        Returns:
+            tuple: (sin_elevación, componente_horizontal, dni) como arrays.
+                La componente horizontal es cos(elevación)·cos(azimut), de
+                forma que cos(incidencia) = sin_el·cos(β) - horizontal·sin(β)
+                para un panel orientado al sur.
+        """
+        declination = np.radians(23.45 * np.sin(np.radians(360 * (284 + days) / 365)))
+        h_angle = np.radians(15 * (hours - 12))
+        
+        sin_elevation = (np.sin(self._latitude) * np.sin(declination) +
+                         np.cos(self._latitude) * np.cos(declination) * np.cos(h_angle))
+        sin_elevation = np.clip(sin_elevation, 0, 1)
+        cos_elevation = np.sqrt(1 - sin_elevation ** 2)
+        
+        # cos(elevación)·cos(azimut), limitado igual que cos_azimuth en [-1, 1]
+        horizontal = (np.sin(declination) * np.cos(self._latitude) -
+                      np.cos(declination) * np.sin(self._latitude) * np.cos(h_angle))
+        horizontal = np.clip(horizontal, -cos_elevation, cos_elevation)
+        
+        # Irradiancia directa normal con la masa de aire limitada a 10
+        daylight = sin_elevation > 0
+        air_mass = np.minimum(np.divide(1, sin_elevation, out=np.full_like(sin_elevation, np.inf),
+                                        where=daylight), 10)
+        dni = np.where(daylight, self._solar_constant * np.exp(air_mass * self._log_atmosphere), 0)
+        
+        return sin_elevation, horizontal, dni
+    
+    def _solar_grid(self, time_step):
+        """
+        Retorna la malla solar de todo el año para un paso de tiempo dado.
+        
+        La malla se calcula una sola vez por instancia y paso de tiempo, ya que
+        solo depende de la latitud y no del ángulo del panel. Se almacena en
+        float32: la precisión sobra para el modelo y se mueven la mitad de bytes
+        en cada evaluación (las sumas se acumulan en float64).
+        
+        Args:
+            time_step (float): Paso de tiempo en horas
+            
+        Returns:
+            tuple: (sin_elevación, componente_horizontal, dni) de forma (365, horas)
+        """
+        grid = self._grid_cache.get(time_step)
+        if grid is None:
+            days = np.arange(1, 366)
+            hours = _hour_grid(time_step)
+            grid = tuple(np.ascontiguousarray(g, dtype=np.float32)
+                         for g in self._sun_position_grid(days[:, None], hours[None, :]))
+            self._grid_cache[time_step] = grid
+        return grid
+    
+    def _daylight_samples(self, time_step):
+        """
+        Retorna la malla de los días representativos compactada a las horas de sol.
+        
+        Los instantes nocturnos (sin_elevación = 0) no aportan energía, así que
+        se descartan una sola vez y la malla (12, horas) se guarda como arrays
+        1D contiguos (estructura de arrays), junto con el peso de cada muestra:
+        número de días que representa por su peso de Simpson en el día. Así
+        los núcleos recorren solo datos útiles.
+        
+        Args:
+            time_step (float): Paso de tiempo en horas
+            
+        Returns:
+            tuple: (sin_elevación, componente_horizontal, dni, pesos) como
+                arrays 1D; los pesos son float64 y el resto float32
+        """
+        samples = self._daylight_cache.get(time_step)
+        if samples is None:
+            grid = tuple(g[REPRESENTATIVE_DAYS - 1] for g in self._solar_grid(time_step))
+            daylight = grid[0] > 0
+            weights = np.multiply.outer(_DAY_WEIGHTS, _hour_weights(time_step))[daylight]
+            samples = tuple(g[daylight] for g in grid) + (weights,)
+            self._daylight_cache[time_step] = samples
+        return samples
+    
+    def _day_grid(self, days, time_step):
+        """
+        Retorna la malla solar de uno o varios días concretos.
+        
+        Usa la malla anual cacheada y solo recalcula la geometría para días
+        fuera del rango 1-365 o no enteros.
+        
+        Args:
+            days (int o np.ndarray): Día(s) del año
+            time_step (float): Paso de tiempo en horas
+            
+        Returns:
+            tuple: (sin_elevación, componente_horizontal, dni) de forma
+                (días..., horas)
+        """
+        days = np.asarray(days)
+        if np.issubdtype(days.dtype, np.integer) and np.all((days >= 1) & (days <= 365)):
+            return tuple(g[days - 1] for g in self._solar_grid(time_step))
+        
+        return self._sun_position_grid(days[..., None], _hour_grid(time_step))
+    
+    def _irradiance_grid(self, panel_tilt, sin_elevation, horizontal, dni):
+        """
+        Calcula la irradiancia total sobre el panel para una malla solar.
+        
+        Args:
+            panel_tilt (np.ndarray): Ángulos de inclinación en grados, con
+                ejes extra para hacer broadcasting contra la malla solar
+            sin_elevation (np.ndarray): Seno de la elevación solar
+            horizontal (np.ndarray): cos(elevación)·cos(azimut)
+            dni (np.ndarray): Irradiancia directa normal en W/m²
+            
+        Returns:
+            np.ndarray: Irradiancia total sobre el panel en W/m²
+        """
+        # Trabajar en la precisión de la malla (float32 para las cacheadas)
+        # La inclinación no varía a lo largo de la malla: su coseno y seno se
+        # calculan una vez por ángulo, no por elemento
+        tilt_rad = np.radians(panel_tilt).astype(sin_elevation.dtype)
+        cos_tilt, sin_tilt = np.cos(tilt_rad), np.sin(tilt_rad)
+        if irradiance_ufunc is not None:
+            return irradiance_ufunc(sin_elevation, horizontal, dni, cos_tilt, sin_tilt)
+        
+        # Operaciones in situ (out=) sobre dos buffers para evitar temporales
+        cos_incidence = np.multiply(sin_elevation, cos_tilt)
+        buffer = np.multiply(horizontal, sin_tilt)
+        np.subtract(cos_incidence, buffer, out=cos_incidence)
+        np.minimum(cos_incidence, 1, out=cos_incidence)
+        
+        # Directa + difusa (0.1·dni) + reflejada del suelo (0.1·dni·sin_el).
+        # De noche dni ya es 0, así que solo falta anular cos_incidence <= 0
+        np.add(cos_incidence, 0.1 + 0.1 * sin_elevation, out=buffer)
+        np.multiply(buffer, dni, out=buffer)
+        np.multiply(buffer, cos_incidence > 0, out=buffer)
+        return buffer
+    
+    def daily_energy_vec(self, panel_tilts, day_of_year, time_step=0.5):
+        """
+        Calcula la energía diaria para varios ángulos en una sola pasada.
+        
+        Equivale a llamar ``daily_energy`` para cada ángulo, pero evalúa
+        todas las horas y ángulos con operaciones vectorizadas de NumPy.
+        
+        Args:
+            panel_tilts (array_like): Ángulos de inclinación en grados
+            day_of_year (int): Día del año (1-365)
+            time_step (float): Paso de tiempo en horas para la integración
+            
+        Returns:
+            np.ndarray: Energía diaria en Wh para cada ángulo
+        """
+        tilts = np.asarray(panel_tilts, dtype=float)[..., None]
+        irradiance = self._irradiance_grid(tilts, *self._day_grid(day_of_year, time_step))
+        
+        return irradiance @ _hour_weights(time_step) * time_step * self._panel_area * self._efficiency
+    
+    def daily_energy_matrix(self, panel_tilts, days_of_year, time_step=0.5):
+        """
+        Calcula la energía diaria para todas las combinaciones (ángulo, día).
+        
+        Args:
+            panel_tilts (array_like): Ángulos de inclinación en grados
+            days_of_year (array_like): Días del año (1-365)
+            time_step (float): Paso de tiempo en horas para la integración
+            
+        Returns:
+            np.ndarray: Energía diaria en Wh de forma (ángulos, días)
+        """
+        tilts = np.asarray(panel_tilts, dtype=float)[:, None, None]
+        grid = self._day_grid(np.asarray(days_of_year), time_step)
+        irradiance = self._irradiance_grid(tilts, *grid)
+        
+        return irradiance @ _hour_weights(time_step) * time_step * self._panel_area * self._efficiency
+
+    def energy_matrix(self, panel_tilts, time_step=0.5):
+        """
+        Calcula la energía diaria de todo el año para varios ángulos.
+
+        Evalúa la malla solar una sola vez para todos los ángulos, de modo que
+        de la misma matriz salen tanto la energía de un día concreto
+        (``E[:, día - 1]``) como la anual
+        (``E[:, REPRESENTATIVE_DAYS - 1] @ DAYS_IN_MONTH / 1000``, igual que
+        ``annual_energy``).
+
+        Args:
+            panel_tilts (array_like): Ángulos de inclinación en grados
+            time_step (float): Paso de tiempo en horas para la integración
+
+        Returns:
+            np.ndarray: Energía diaria en Wh de forma (ángulos, 365)
+        """
+        return self.daily_energy_matrix(panel_tilts, np.arange(1, 366), time_step)
+
+    def annual_energy_vec(self, panel_tilts, time_step=0.5):
+        """
+        Calcula la energía anual para varios ángulos en una sola pasada.
+        
+        Equivale a llamar ``annual_energy`` para cada ángulo, usando una malla
+        (ángulos, muestras con sol) evaluada por broadcasting.
+        
+        Args:
+            panel_tilts (array_like): Ángulos de inclinación en grados
+            time_step (float): Paso de tiempo en horas para la integración diaria
+            
+        Returns:
+            np.ndarray: Energía anual en kWh para cada ángulo
+        """
+        tilts = np.asarray(panel_tilts, dtype=float)
+        scale = self._panel_area * self._efficiency * time_step
+        *grid, weights = self._daylight_samples(time_step)
+        
+        if annual_energy_batch is not None:
+            energies = annual_energy_batch(*grid, weights, np.radians(tilts).ravel(), scale)
+            return energies.reshape(tilts.shape) / 1000  # Convertir a kWh
+        
+        irradiance = self._irradiance_grid(tilts[..., None], *grid)
+        return np.dot(irradiance, weights) * scale / 1000  # Convertir a kWh
+    
+    def get_optimal_angles_range(self):
+        """
+        Retorna el rango recomendado de ángulos para la optimización.
+        
+        Returns:
+            tuple: (ángulo_mínimo, ángulo_máximo) en grados
+        """
+        lat_deg = math.degrees(self._latitude)
+        min_angle = max(0, lat_deg - 20)
+        max_angle = min(90, lat_deg + 20)
+        return min_angle, max_angle
+
+
+@lru_cache(maxsize=16)
+def cached_model(latitude, panel_area=1.0, efficiency=0.2):
+    """
+    Crea (o reutiliza) un modelo de panel solar.
+    
+    El modelo precalcula sus mallas solares al construirse, así que repetir
+    un cálculo con los mismos parámetros no vuelve a pagar ese coste. Las
+    llamadas con los mismos parámetros comparten la misma instancia.
+    
+    Args:
+        latitude (float): Latitud geográfica en grados
+        panel_area (float): Área del panel en m²
+        efficiency (float): Eficiencia del panel (0-1)
+        
+    Returns:
+        SolarPanelModel: Modelo del panel solar
+    """
+    return SolarPanelModel(latitude, panel_area, efficiency)
@@ -0,0 +1,202 @@
+"""
+Núcleos compilados con Numba para el modelo de panel solar.
+Contiene las versiones JIT de los cálculos más costosos de SolarPanelModel.
+Numba es una dependencia opcional: si no está instalado, importar este
+módulo lanza ImportError y el modelo usa su implementación con NumPy.
+"""
+
+from math import sin, cos, asin, atan2, exp, radians, pi
+
+import numpy as np
+from numba import njit, prange, vectorize, float32, float64
+
+
+@njit(cache=True, fastmath=True)
+def irradiance(sin_elevation, horizontal, dni, cos_tilt, sin_tilt):
+    """
+    Calcula la irradiancia total sobre el panel para un instante.
+
+    Args:
+        sin_elevation (float): Seno de la elevación solar
+        horizontal (float): cos(elevación)·cos(azimut)
+        dni (float): Irradiancia directa normal en W/m²
+        cos_tilt (float): Coseno de la inclinación del panel
+        sin_tilt (float): Seno de la inclinación del panel
+
+    Returns:
+        float: Irradiancia total sobre el panel en W/m²
+    """
+    if sin_elevation <= 0:
+        return 0.0
+
+    cos_incidence = sin_elevation * cos_tilt - horizontal * sin_tilt
+    if cos_incidence <= 0:
+        return 0.0
+
+    # Directa + difusa (0.1·dni) + reflejada del suelo (0.1·dni·sin_el)
+    return dni * (min(cos_incidence, 1.0) + 0.1 + 0.1 * sin_elevation)
+
+
+@njit(float64(float64, float64, float64, float64, float64, float64, float64),
+      nogil=True, cache=True)
+def instant_power(latitude, tilt, day_of_year, hour, solar_constant,
+                  log_atmosphere, area_efficiency):
+    """
+    Potencia instantánea del panel con la misma cadena trigonométrica que
+    ``SolarPanelModel.instantaneous_power``, compilada en una sola función.
+
+    Sin ``fastmath``: al amanecer y al atardecer la elevación es ~0 y el
+    signo del redondeo decide si el panel produce o no.
+
+    Args:
+        latitude (float): Latitud en radianes
+        tilt (float): Inclinación del panel en radianes
+        day_of_year (float): Día del año (1-365)
+        hour (float): Hora del día (0-24)
+        solar_constant (float): Constante solar en W/m²
+        log_atmosphere (float): Logaritmo del factor de atenuación atmosférica
+        area_efficiency (float): Área · eficiencia del panel
+
+    Returns:
+        float: Potencia instantánea en vatios
+    """
+    declination = radians(23.45 * sin(radians(360 * (284 + day_of_year) / 365)))
+    h_angle = radians(15 * (hour - 12))
+    sin_elevation = (sin(latitude) * sin(declination) +
+                     cos(latitude) * cos(declination) * cos(h_angle))
+    elevation = asin(max(0.0, sin_elevation))
+    if elevation <= 0:
+        return 0.0
+
+    azimuth = atan2(-cos(declination) * sin(h_angle),
+                    sin(declination) * cos(latitude) -
+                    cos(declination) * sin(latitude) * cos(h_angle))
+
+    # Panel orientado al sur (azimut π)
+    cos_incidence = (sin(elevation) * cos(tilt) +
+                     cos(elevation) * sin(tilt) * cos(azimuth - pi))
+    cos_incidence = min(1.0, cos_incidence)
+    if cos_incidence <= 0:
+        return 0.0
+
+    dni = max(0.0, solar_constant * exp(min(1 / sin(elevation), 10.0) * log_atmosphere))
+    return max(0.0, dni * (cos_incidence + 0.1 + 0.1 * sin(elevation))) * area_efficiency
+
+
+@vectorize([float32(float32, float32, float32, float32, float32),
+            float64(float64, float64, float64, float64, float64)], cache=True)
+def irradiance_ufunc(sin_elevation, horizontal, dni, cos_tilt, sin_tilt):
+    """
+    Versión ufunc de ``irradiance`` con broadcasting estilo NumPy.
+
+    Recibe el coseno y el seno de la inclinación ya calculados: la inclinación
+    es constante a lo largo de los ejes de la malla solar, así que no se
+    recalculan en cada elemento (igual que en los núcleos ``njit``). Se compila
+    para un solo hilo (``target='cpu'``): las llamadas de las búsquedas son de
+    uno o pocos ángulos, donde arrancar la reserva de hilos cuesta más que
+    el cálculo.
+
+    Args:
+        sin_elevation (np.ndarray): Seno de la elevación solar
+        horizontal (np.ndarray): cos(elevación)·cos(azimut)
+        dni (np.ndarray): Irradiancia directa normal en W/m²
+        cos_tilt (np.ndarray): Coseno de la inclinación del panel
+        sin_tilt (np.ndarray): Seno de la inclinación del panel
+
+    Returns:
+        np.ndarray: Irradiancia total sobre el panel en W/m²
+    """
+    return irradiance(sin_elevation, horizontal, dni, cos_tilt, sin_tilt)
+
+
+@njit(float64(float32[::1], float32[::1], float32[::1], float64[::1], float64, float64),
+      nogil=True, cache=True, fastmath=True)
+def daily_energy_core(sin_elevation, horizontal, dni, weights, tilt, scale):
+    """
+    Integra la irradiancia de un día sobre una fila de la malla solar.
+
+    Lleva firma explícita para compilarse al importar el módulo y no al
+    primer clic en "Optimizar".
+
+    Args:
+        sin_elevation (np.ndarray): Seno de la elevación solar (horas)
+        horizontal (np.ndarray): cos(elevación)·cos(azimut) (horas)
+        dni (np.ndarray): Irradiancia directa normal en W/m² (horas)
+        weights (np.ndarray): Peso de Simpson de cada hora
+        tilt (float): Inclinación del panel en radianes
+        scale (float): Área · eficiencia · paso de tiempo
+
+    Returns:
+        float: Energía del día en Wh
+    """
+    cos_tilt = cos(tilt)
+    sin_tilt = sin(tilt)
+
+    total = 0.0
+    for h in range(sin_elevation.shape[0]):
+        total += weights[h] * irradiance(sin_elevation[h], horizontal[h], dni[h],
+                                         cos_tilt, sin_tilt)
+
+    return total * scale
+
+
+@njit(nogil=True, cache=True, fastmath=True)
+def annual_energy_core(sin_elevation, horizontal, dni, weights, tilt, scale):
+    """
+    Integra la irradiancia sobre las muestras con sol precalculadas.
+
+    Args:
+        sin_elevation (np.ndarray): Seno de la elevación solar (1D)
+        horizontal (np.ndarray): cos(elevación)·cos(azimut) (1D)
+        dni (np.ndarray): Irradiancia directa normal en W/m² (1D)
+        weights (np.ndarray): Días representados × peso de Simpson de la muestra
+        tilt (float): Inclinación del panel en radianes
+        scale (float): Área · eficiencia · paso de tiempo
+
+    Returns:
+        float: Energía total en Wh
+    """
+    cos_tilt = cos(tilt)
+    sin_tilt = sin(tilt)
+
+    total = 0.0
+    for i in range(sin_elevation.shape[0]):
+        total += weights[i] * irradiance(sin_elevation[i], horizontal[i], dni[i],
+                                         cos_tilt, sin_tilt)
+
+    return total * scale
+
+
+@njit(parallel=True, nogil=True, cache=True, fastmath=True)
+def annual_energy_batch(sin_elevation, horizontal, dni, weights, tilts, scale):
+    """
+    Calcula la energía anual de varios ángulos repartiéndolos entre hilos.
+
+    Cada hilo integra ángulos completos con ``annual_energy_core``, de modo
+    que el bucle interno sobre las muestras sigue siendo secuencial.
+
+    Args:
+        sin_elevation (np.ndarray): Seno de la elevación solar (1D)
+        horizontal (np.ndarray): cos(elevación)·cos(azimut) (1D)
+        dni (np.ndarray): Irradiancia directa normal en W/m² (1D)
+        weights (np.ndarray): Días representados × peso de Simpson de la muestra
+        tilts (np.ndarray): Inclinaciones del panel en radianes
+        scale (float): Área · eficiencia · paso de tiempo
+
+    Returns:
+        np.ndarray: Energía total en Wh para cada ángulo
+    """
+    energies = np.empty(tilts.shape[0])
+    for i in prange(tilts.shape[0]):
+        energies[i] = annual_energy_core(sin_elevation, horizontal, dni,
+                                         weights, tilts[i], scale)
+    return energies
+
+
+# Compilar (o cargar desde caché) al importar, con los tipos de las muestras
+# cacheadas (float32 y pesos float64), para no pagar la latencia del JIT en la
+# primera optimización
+_samples = np.zeros(1, dtype=np.float32)
+_weights = np.ones(1)
+annual_energy_core(_samples, _samples, _samples, _weights, 0.0, 1.0)
+annual_energy_batch(_samples, _samples, _samples, _weights, np.zeros(1), 1.0)
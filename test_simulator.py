@@ -4,15 +4,13 @@ No requiere PyQt5, solo usa las clases principales.
 """
 
 import sys
-import os
 import numpy as np
-
-# Agregar src al path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from scipy.integrate import simpson
+from scipy.optimize import minimize_scalar
 
 try:
-    from solar_panel_model import SolarPanelModel
-    from numerical_methods import NumericalOptimizer
+    from modelo_panel_ifer2025 import SolarPanelModel, NumericalOptimizer
+    from modelo_panel_ifer2025.solar_panel_model import REPRESENTATIVE_DAYS, DAYS_IN_MONTH
     print("✓ Importaciones exitosas")
 except ImportError as e:
     print(f"✗ Error de importación: {e}")
@@ -78,7 +76,8 @@ def test_basic_functionality():
         # Solo probar los métodos más rápidos
         methods_to_test = [
             ('ternary_search', 'Búsqueda ternaria'),
-            ('golden_section_search', 'Sección áurea')
+            ('golden_section_search', 'Sección áurea'),
+            ('gradient_ascent', 'Ascenso por gradiente')
         ]
         
         for method_name, display_name in methods_to_test:
@@ -170,6 +169,131 @@ def test_model_calculations():
         print(f"✗ Error en cálculos del modelo: {e}")
 
 
+def test_vectorized_energy():
+    """Prueba que las versiones vectorizadas coinciden con las escalares."""
+    print("\n=== PRUEBA DE CÁLCULOS VECTORIZADOS ===")
+    
+    model = SolarPanelModel(latitude=40.4, panel_area=1.0, efficiency=0.20)
+    angles = np.arange(0, 91, 5)
+    
+    daily_vec = model.daily_energy_vec(angles, 172)
+    daily_scalar = [model.daily_energy(angle, 172) for angle in angles]
+    hours = np.arange(6, 18.5, 0.5)
+    daily_reference = [simpson([model.instantaneous_power(angle, 172, hour) for hour in hours], x=hours)
+                       for angle in angles]
+    assert np.allclose(model.daily_energy(angles, 172), daily_vec)
+    assert np.allclose(daily_vec, daily_scalar)
+    assert np.allclose(daily_vec, daily_reference)
+    print(f"✓ Energía diaria vectorizada ({len(angles)} ángulos)")
+    
+    annual_vec = model.annual_energy_vec(angles)
+    annual_scalar = [model.annual_energy(angle) for angle in angles]
+    assert np.allclose(annual_vec, annual_scalar)
+    print(f"✓ Energía anual vectorizada ({len(angles)} ángulos)")
+    
+    days = [80, 172, 266, 355]
+    matrix = model.daily_energy_matrix(angles, days)
+    matrix_scalar = [[model.daily_energy(angle, day) for day in days] for angle in angles]
+    assert matrix.shape == (len(angles), len(days))
+    assert np.allclose(matrix, matrix_scalar)
+    print(f"✓ Matriz de energía diaria ({len(angles)} ángulos × {len(days)} días)")
+    
+    year = model.energy_matrix(angles)
+    assert year.shape == (len(angles), 365)
+    assert np.allclose(year[:, 172 - 1], daily_vec)
+    assert np.allclose(year[:, REPRESENTATIVE_DAYS - 1] @ DAYS_IN_MONTH / 1000, annual_vec)
+    print("✓ Matriz anual de energía coherente con diaria y anual")
+
+
+def test_compare_methods_bounds():
+    """Prueba que todos los métodos respetan el intervalo de búsqueda."""
+    print("\n=== PRUEBA DE LÍMITES EN LA COMPARACIÓN DE MÉTODOS ===")
+    
+    optimizer = NumericalOptimizer(SolarPanelModel(latitude=40.4, panel_area=2.0, efficiency=0.22))
+    
+    # El óptimo diario de verano (~8.6°) queda fuera del intervalo, así que
+    # un método que ignore los límites se sale de él
+    min_angle, max_angle = 20.4, 60.4
+    for optimization_type in ('daily', 'annual'):
+        results = optimizer.compare_methods(min_angle, max_angle, optimization_type)
+        for name, data in results.items():
+            assert 'error' not in data, data
+            assert min_angle <= data['angle'] <= max_angle, (name, data['angle'])
+    assert abs(results['gradient_ascent']['angle'] - results['golden_section']['angle']) < 0.1
+    print(f"✓ Todos los métodos dentro de [{min_angle}°, {max_angle}°]")
+
+
+def test_track_history():
+    """Prueba el historial opcional y el recuento de evaluaciones."""
+    print("\n=== PRUEBA DE HISTORIAL Y EVALUACIONES ===")
+    
+    optimizer = NumericalOptimizer(SolarPanelModel(latitude=40.4, panel_area=2.0, efficiency=0.22))
+    # Mismos argumentos que compare_methods(0, 90), por nombre de método
+    calls = {
+        'brute_force': (optimizer.brute_force_search, (0, 90, 1.0)),
+        'ternary_search': (optimizer.ternary_search, (0, 90, 1e-2)),
+        'golden_section': (optimizer.golden_section_search, (0, 90, 1e-2)),
+        'gradient_ascent': (optimizer.gradient_ascent, (45, 0.1, 1e-2)),
+    }
+    for method, args in calls.values():
+        angle, energy, history = method(*args, 'annual')
+        quiet_angle, quiet_energy, evaluations = method(*args, 'annual', track_history=False)
+        assert history.shape == (len(history), 2) and len(history) > 0
+        assert isinstance(evaluations, int) and evaluations == len(history), method.__name__
+        assert (quiet_angle, quiet_energy) == (angle, energy), method.__name__
+        assert type(angle) is float and type(energy) is float, method.__name__
+    
+    # Las evaluaciones de gradient_ascent son las de minimize_scalar
+    _, _, evaluations = optimizer.gradient_ascent(45, 0.1, 1e-2, 'annual', track_history=False)
+    reference = minimize_scalar(lambda a: -optimizer.energy(a, 'annual'), bounds=(0, 90),
+                                method='bounded', options={'xatol': 1e-2})
+    assert evaluations == reference.nfev
+    
+    results = optimizer.compare_methods(0, 90, 'annual')
+    assert set(results) == set(calls)
+    for name, data in results.items():
+        method, args = calls[name]
+        assert set(data) == {'angle', 'energy', 'evaluations'}, name
+        assert data['evaluations'] == method(*args, 'annual', track_history=False)[2], name
+    print("✓ track_history=False devuelve el número de evaluaciones del historial")
+
+
+def test_best_evaluated_point():
+    """Prueba que las búsquedas y la sensibilidad reutilizan la energía ya evaluada."""
+    print("\n=== PRUEBA DEL MEJOR PUNTO EVALUADO ===")
+    
+    optimizer = NumericalOptimizer(SolarPanelModel(latitude=40.4, panel_area=2.0, efficiency=0.22))
+    
+    # Ternaria y sección áurea devuelven el mejor punto que evaluaron
+    for method in (optimizer.ternary_search, optimizer.golden_section_search):
+        for optimization_type in ('daily', 'annual'):
+            angle, energy, history = method(0, 90, 1e-2, optimization_type)
+            best = history[np.argmax(history[:, 1])]
+            assert (angle, energy) == tuple(best), method.__name__
+    print("✓ Ternaria y sección áurea devuelven el mejor punto evaluado")
+    
+    # optimal_energy evita reevaluar el óptimo sin cambiar el resultado. Sin
+    # Numba, el cálculo de un solo ángulo y el de la muestra entera pueden
+    # diferir en el redondeo de la suma
+    angle, energy, _ = optimizer.golden_section_search(0, 90, 1e-2, 'annual')
+    optimal_energy = optimizer.energy_vec(np.array([angle]), 'annual')[0]
+    computed = optimizer.sensitivity_analysis(angle, 10, 'annual')
+    given = optimizer.sensitivity_analysis(angle, 10, 'annual', optimal_energy=optimal_energy)
+    assert computed.shape == (21, 3)
+    assert np.allclose(computed, given, rtol=1e-12, atol=1e-10)
+    assert computed[:, 2].min() > -1e-3  # Pérdida ~0 en el óptimo, no negativa
+    
+    # Noche polar: energía 0 en el óptimo, la pérdida porcentual no está definida
+    polar = NumericalOptimizer(SolarPanelModel(latitude=80))
+    try:
+        polar.sensitivity_analysis(30, 10, 'daily', 355)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("sensitivity_analysis debe rechazar una energía óptima nula")
+    print("✓ Análisis de sensibilidad con y sin optimal_energy")
+
+
 def main():
     """Función principal de prueba."""
     print("SIMULADOR DE PANEL SOLAR - PRUEBAS SIN INTERFAZ GRÁFICA")
@@ -189,13 +313,17 @@ def main():
         # Pruebas adicionales
         test_different_latitudes()
         test_model_calculations()
+        test_vectorized_energy()
+        test_compare_methods_bounds()
+        test_track_history()
+        test_best_evaluated_point()
         
         print("\n" + "=" * 60)
         print("✓ TODAS LAS PRUEBAS COMPLETADAS EXITOSAMENTE")
         print("\nEl simulador está funcionando correctamente.")
         print("Para usar la interfaz gráfica, instale PyQt5:")
         print("  pip install PyQt5")
-        print("  python src/main.py")
+        print("  python -m modelo_panel_ifer2025.main")
         
     except Exception as e:
         print(f"\n✗ Error inesperado durante las pruebas: {e}")